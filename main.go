@@ -1,6 +1,7 @@
 package main
 
 import (
+	"flag"
 	"log"
 	"time"
 
@@ -23,7 +24,18 @@ var scene *core.Node
 var mesh *core.Node
 var windEnabled bool
 
+var quiet = flag.Bool("quiet", false, "skip per-frame simulation logging")
+
+// logFrame logs per-frame diagnostics unless -quiet is given
+func logFrame(format string, args ...interface{}) {
+	if !*quiet {
+		log.Printf(format, args...)
+	}
+}
+
 func main() {
+	flag.Parse()
+
 	a := app.App()
 	scene = core.NewNode()
 	ml := &ModelLoader{scene: scene}
@@ -76,24 +88,24 @@ func main() {
 		a.Gls().Clear(gls.DEPTH_BUFFER_BIT | gls.STENCIL_BUFFER_BIT | gls.COLOR_BUFFER_BIT)
 		renderer.Render(scene, cam)
 
-		log.Printf("Scene children count: %d, Wind particles: %d", len(scene.Children()), len(windParticles))
+		logFrame("Scene children count: %d, Wind particles: %d", len(scene.Children()), len(windParticles))
 
 		// Continuous particle generation from wind sources
 		if windEnabled {
 			if time.Since(lastParticleTime).Milliseconds() >= 100 { // Spawn every 100ms
 				for _, wind := range windSources {
 					windParticles = append(windParticles, createWindParticle(wind.Position, wind.Direction))
-					log.Printf("Spawning particle from wind source at: %v, Direction: %v", wind.Position, wind.Direction)
+					logFrame("Spawning particle from wind source at: %v, Direction: %v", wind.Position, wind.Direction)
 				}
 				lastParticleTime = time.Now()
 			}
 		}
 
 		if mesh != nil {
-			log.Printf("Mesh is present at position: %v", mesh.Position())
+			logFrame("Mesh is present at position: %v", mesh.Position())
 			updatePhysics(mesh, windSources, float32(deltaTime.Seconds()))
 		} else {
-			log.Println("Mesh is nil")
+			logFrame("Mesh is nil")
 		}
 		updateWindParticles(float32(deltaTime.Seconds()), scene, mesh)
 
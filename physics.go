@@ -1,8 +1,6 @@
 package main
 
 import (
-	"log"
-
 	"github.com/g3n/engine/core"
 	"github.com/g3n/engine/math32"
 )
@@ -19,12 +17,12 @@ const gravity = -9.8
 
 func updatePhysics(mesh *core.Node, windSources []WindSource, dt float32) {
 	if mesh == nil {
-		log.Println("No mesh present in physics update")
+		logFrame("No mesh present in physics update")
 		return
 	}
 
 	torusPos := mesh.Position()
-	log.Printf("Mesh position: %v", torusPos)
+	logFrame("Mesh position: %v", torusPos)
 
 	totalForce := math32.NewVector3(0, 0, 0)
 	angularMomentum := math32.NewVector3(0, 0, 0)
@@ -35,7 +33,7 @@ func updatePhysics(mesh *core.Node, windSources []WindSource, dt float32) {
 		wind := &windSources[i]
 		distanceVec := torusPos.Clone().Sub(&wind.Position)
 		distance := distanceVec.Length()
-		log.Printf("Wind source %d at %v, Distance to mesh: %v, Radius: %v", i, wind.Position, distance, wind.Radius)
+		logFrame("Wind source %d at %v, Distance to mesh: %v, Radius: %v", i, wind.Position, distance, wind.Radius)
 
 		if distance <= wind.Radius {
 			windVelocity := wind.Direction.Clone().MultiplyScalar(wind.Speed)
@@ -47,7 +45,7 @@ func updatePhysics(mesh *core.Node, windSources []WindSource, dt float32) {
 			angularMomentum.Add(dragForce.Cross(&torusPos))
 
 			windParticles = append(windParticles, createWindParticle(wind.Position, wind.Direction))
-			log.Printf("Particle created at position: %v, Distance to mesh: %v", wind.Position, distance)
+			logFrame("Particle created at position: %v, Distance to mesh: %v", wind.Position, distance)
 		}
 	}
 
@@ -74,7 +72,7 @@ func updatePhysics(mesh *core.Node, windSources []WindSource, dt float32) {
 	}
 	mesh.SetPositionVec(newPos)
 
-	log.Printf("Physics update - New position: %v, Velocity: %v", newPos, velocity)
+	logFrame("Physics update - New position: %v, Velocity: %v", newPos, velocity)
 
 	recordSimulationData(dt, *acceleration, windPower, *angularMomentum, dampingEffect)
 }
@@ -1,7 +1,9 @@
 package main
 
 import (
+	"bufio"
 	"encoding/json"
+	"flag"
 	"fmt"
 	"log"
 	"os"
@@ -18,24 +20,92 @@ type SimulationData struct {
 	DampingEffect   float32
 }
 
-var simulationData []SimulationData
+var simulationJSONLines = flag.Bool("jsonl", false, "write simulation data as JSON Lines, one record per line")
+
+// Records are handed to a writer goroutine, which encodes and streams them to
+// the output file. The render loop only blocks on JSON encoding or disk I/O
+// when the writer falls more than 1024 records behind.
+var simulationRecords chan SimulationData
+var simulationDone chan struct{}
+
+// Set when the output file could not be created, so recording is skipped
+// for the rest of the run instead of retried every frame
+var simulationRecordingDisabled bool
+
+func startSimulationRecording() bool {
+	ext := "json"
+	if *simulationJSONLines {
+		ext = "jsonl"
+	}
+	filename := fmt.Sprintf("simulation_data_%d.%s", time.Now().UnixNano(), ext)
+	file, err := os.Create(filename)
+	if err != nil {
+		log.Println("Error creating simulation data file, simulation data will not be recorded:", err)
+		return false
+	}
+	simulationRecords = make(chan SimulationData, 1024)
+	simulationDone = make(chan struct{})
+	go writeSimulationData(file, simulationRecords, simulationDone)
+	return true
+}
+
+func writeSimulationData(file *os.File, records <-chan SimulationData, done chan<- struct{}) {
+	defer close(done)
+	defer file.Close()
+
+	writer := bufio.NewWriterSize(file, 64*1024)
+	if !*simulationJSONLines {
+		writer.WriteString("[")
+	}
+	count := 0
+	for record := range records {
+		// Encode before writing the separator so a record that fails to
+		// encode (e.g. an infinite value) leaves the output well formed
+		data, err := json.Marshal(record)
+		if err != nil {
+			log.Println("Error writing simulation data:", err)
+			continue
+		}
+		if count > 0 && !*simulationJSONLines {
+			writer.WriteString(",")
+		}
+		writer.Write(data)
+		writer.WriteString("\n")
+		count++
+	}
+	if !*simulationJSONLines {
+		writer.WriteString("]\n")
+	}
+	if err := writer.Flush(); err != nil {
+		log.Println("Error writing simulation data:", err)
+	}
+}
 
 func recordSimulationData(dt float32, acceleration math32.Vector3, windPower float32, angularMomentum math32.Vector3, dampingEffect float32) {
-	simulationData = append(simulationData, SimulationData{
+	// The output file is only created once there is something to record
+	if simulationRecords == nil {
+		if simulationRecordingDisabled {
+			return
+		}
+		if !startSimulationRecording() {
+			simulationRecordingDisabled = true
+			return
+		}
+	}
+	simulationRecords <- SimulationData{
 		Time:            float32(time.Now().UnixNano()) / 1e9,
 		Acceleration:    acceleration,
 		WindPower:       windPower,
 		AngularMomentum: angularMomentum,
 		DampingEffect:   dampingEffect,
-	})
+	}
 }
 
 func saveSimulationData() {
-	filename := fmt.Sprintf("simulation_data_%d.json", time.Now().UnixNano())
-	file, err := os.Create(filename)
-	if err != nil {
-		log.Fatal("Error creating simulation data file: ", err)
+	if simulationRecords == nil {
+		return
 	}
-	defer file.Close()
-	json.NewEncoder(file).Encode(simulationData)
+	close(simulationRecords)
+	<-simulationDone
+	simulationRecords = nil
 }
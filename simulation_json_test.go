@@ -0,0 +1,84 @@
+package main
+
+import (
+	"bufio"
+	"bytes"
+	"encoding/json"
+	"math"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/g3n/engine/math32"
+)
+
+func writeTestSimulationData(t *testing.T, jsonLines bool) []byte {
+	t.Helper()
+	saved := *simulationJSONLines
+	*simulationJSONLines = jsonLines
+	defer func() { *simulationJSONLines = saved }()
+
+	path := filepath.Join(t.TempDir(), "simulation_data")
+	file, err := os.Create(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	records := make(chan SimulationData, 4)
+	done := make(chan struct{})
+	go writeSimulationData(file, records, done)
+
+	inf := float32(math.Inf(1))
+	records <- SimulationData{WindPower: 1, Acceleration: math32.Vector3{X: 1, Y: 2, Z: 3}}
+	records <- SimulationData{WindPower: inf}
+	records <- SimulationData{WindPower: 3}
+	records <- SimulationData{WindPower: inf}
+	close(records)
+	<-done
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		t.Fatal(err)
+	}
+	return data
+}
+
+func checkWindPowers(t *testing.T, got []SimulationData) {
+	t.Helper()
+	want := []float32{1, 3}
+	if len(got) != len(want) {
+		t.Fatalf("got %d records, want %d", len(got), len(want))
+	}
+	for i := range want {
+		if got[i].WindPower != want[i] {
+			t.Errorf("record %d: WindPower = %v, want %v", i, got[i].WindPower, want[i])
+		}
+	}
+	if got[0].Acceleration != (math32.Vector3{X: 1, Y: 2, Z: 3}) {
+		t.Errorf("record 0: Acceleration = %v", got[0].Acceleration)
+	}
+}
+
+func TestWriteSimulationDataArray(t *testing.T) {
+	data := writeTestSimulationData(t, false)
+
+	var got []SimulationData
+	if err := json.Unmarshal(data, &got); err != nil {
+		t.Fatalf("output is not a valid JSON array: %v\n%s", err, data)
+	}
+	checkWindPowers(t, got)
+}
+
+func TestWriteSimulationDataJSONLines(t *testing.T) {
+	data := writeTestSimulationData(t, true)
+
+	var got []SimulationData
+	scanner := bufio.NewScanner(bytes.NewReader(data))
+	for scanner.Scan() {
+		var record SimulationData
+		if err := json.Unmarshal(scanner.Bytes(), &record); err != nil {
+			t.Fatalf("line %q is not valid JSON: %v", scanner.Text(), err)
+		}
+		got = append(got, record)
+	}
+	checkWindPowers(t, got)
+}
@@ -59,9 +59,6 @@ func initializeUI(scene *core.Node, windSources []WindSource, ml *ModelLoader, c
 
 		addWindBtn.SetSize(btnWidth, btnHeight)
 		addWindBtn.SetPosition(btnX, btnY+btnHeight+10)
-
-		addWindBtn.SetSize(btnWidth, btnHeight)
-		addWindBtn.SetPosition(btnX, btnY+btnHeight+10)
 	}
 
 	app.App().Subscribe(window.OnWindowSize, func(evname string, ev interface{}) {
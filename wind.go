@@ -1,7 +1,6 @@
 package main
 
 import (
-	"log"
 	"math/rand"
 
 	"github.com/g3n/engine/core"
@@ -65,11 +64,18 @@ func addWindSource(windSource []WindSource, scene *core.Node, position math32.Ve
 	return append(windSource, newWind)
 }
 
+// Geometry and material shared by all wind particles, built on first use
+var windParticleGeom *geometry.Geometry
+var windParticleMat *material.Standard
+
 func createWindParticle(position, direction math32.Vector3) *WindParticle {
 	// Create a thin cylinder to represent wind direction
-	particleGeom := geometry.NewCylinder(0.05, 0.5, 8, 1, true, true) // Use integer values for segments
-	particleMat := material.NewStandard(math32.NewColor("Cyan"))      // Bright color for visibility
-	particleMesh := graphic.NewMesh(particleGeom, particleMat)        // Use NewMesh instead of MeshFromGeometry
+	if windParticleGeom == nil {
+		windParticleGeom = geometry.NewCylinder(0.05, 0.5, 8, 1, true, true) // Use integer values for segments
+		windParticleMat = material.NewStandard(math32.NewColor("Cyan"))      // Bright color for visibility
+	}
+	windParticleMat.Incref()
+	particleMesh := graphic.NewMesh(windParticleGeom.Incref(), windParticleMat) // Use NewMesh instead of MeshFromGeometry
 
 	// Position the particle
 	particleMesh.SetPosition(position.X, position.Y, position.Z)
@@ -81,7 +87,7 @@ func createWindParticle(position, direction math32.Vector3) *WindParticle {
 	// Apply the rotation
 	particleMesh.SetRotation(pitch, yaw, 0)
 
-	log.Printf("Adding wind particle at position: %v, Direction: %v", position, direction)
+	logFrame("Adding wind particle at position: %v, Direction: %v", position, direction)
 	scene.Add(particleMesh)
 
 	return &WindParticle{
@@ -93,13 +99,30 @@ func createWindParticle(position, direction math32.Vector3) *WindParticle {
 }
 
 func updateWindParticles(deltaTime float32, scene *core.Node, mesh *core.Node) {
-	var newParticles []*WindParticle
-	log.Printf("Processing %d wind particles", len(windParticles))
+	// Surviving particles are compacted in place to reuse the backing array
+	newParticles := windParticles[:0]
+	logFrame("Processing %d wind particles", len(windParticles))
+
+	// The mesh bounds are the same for every particle, so compute them once per frame
+	checkCollision := false
+	center := math32.NewVector3(0, 0, 0)
+	halfExtents := math32.NewVector3(0, 0, 0)
+	if mesh != nil {
+		meshPos := mesh.Position()
+		meshBounds := mesh.BoundingBox()
+		if !meshBounds.Min.Equals(&meshBounds.Max) {
+			meshBounds.Center(center)
+			meshBounds.Size(halfExtents)
+			halfExtents.MultiplyScalar(0.5)
+			center.Add(&meshPos)
+			checkCollision = true
+		}
+	}
 
 	for _, particle := range windParticles {
 		particle.Elapsed += deltaTime
 		if particle.Elapsed >= particle.Lifespan {
-			log.Printf("Removing particle at position: %v", particle.Mesh.Position())
+			logFrame("Removing particle at position: %v", particle.Mesh.Position())
 			scene.Remove(particle.Mesh)
 			continue
 		}
@@ -110,30 +133,18 @@ func updateWindParticles(deltaTime float32, scene *core.Node, mesh *core.Node) {
 		particle.Mesh.SetPositionVec(&pos)
 
 		// Check collision with mesh
-		if mesh != nil {
-			meshPos := mesh.Position()
-			meshBounds := mesh.BoundingBox()
-			if !meshBounds.Min.Equals(&meshBounds.Max) {
-				center := math32.NewVector3(0, 0, 0)
-				meshBounds.Center(center)
-				size := math32.NewVector3(0, 0, 0)
-				meshBounds.Size(size)
-				halfExtents := size.MultiplyScalar(0.5)
-				center.Add(&meshPos)
-
-				if math32.Abs(pos.X-center.X) < halfExtents.X &&
-					math32.Abs(pos.Y-center.Y) < halfExtents.Y &&
-					math32.Abs(pos.Z-center.Z) < halfExtents.Z {
-					normal := center.Sub(&pos).Normalize()
-					particle.Velocity.Reflect(normal).MultiplyScalar(0.7) // Bounce with reduced speed
-					continue
-				}
-			}
+		if checkCollision &&
+			math32.Abs(pos.X-center.X) < halfExtents.X &&
+			math32.Abs(pos.Y-center.Y) < halfExtents.Y &&
+			math32.Abs(pos.Z-center.Z) < halfExtents.Z {
+			normal := center.Clone().Sub(&pos).Normalize()
+			particle.Velocity.Reflect(normal).MultiplyScalar(0.7) // Bounce with reduced speed
+			continue
 		}
 
 		// Keep particle in scene bounds (optional)
 		if pos.Length() > 20 {
-			log.Printf("Particle out of bounds at: %v", pos)
+			logFrame("Particle out of bounds at: %v", pos)
 			scene.Remove(particle.Mesh)
 			continue
 		}
@@ -141,6 +152,10 @@ func updateWindParticles(deltaTime float32, scene *core.Node, mesh *core.Node) {
 		newParticles = append(newParticles, particle)
 	}
 
+	// Drop references to removed particles so they can be collected
+	for i := len(newParticles); i < len(windParticles); i++ {
+		windParticles[i] = nil
+	}
 	windParticles = newParticles
 }
 
@@ -155,12 +170,9 @@ type VectorField struct {
 }
 
 type Vector struct {
-	VX  float32
-	VY  float32
-	VZ  float32
-	VX_ float32
-	VY_ float32
-	VZ_ float32
+	VX float32
+	VY float32
+	VZ float32
 }
 
 type Particle struct {
@@ -190,18 +202,21 @@ func clamp(value, min, max float32) float32 {
 	return value
 }
 
-func calcMagnitude3D(x, y, z float32) float32 {
-	return float32(math32.Sqrt(x*x + y*y + z*z))
+func calcMagnitudeSq3D(x, y, z float32) float32 {
+	return x*x + y*y + z*z
 }
 
 func initVectorField(width, height, depth, areaWidth, areaHeight, areaDepth int) VectorField {
+	// All cells live in one contiguous allocation, sliced into the 3D grid
+	cells := make([]Vector, areaWidth*areaHeight*areaDepth)
 	field := make([][][]Vector, areaWidth)
 	for x := 0; x < areaWidth; x++ {
 		field[x] = make([][]Vector, areaHeight)
 		for y := 0; y < areaHeight; y++ {
-			field[x][y] = make([]Vector, areaDepth)
+			start := (x*areaHeight + y) * areaDepth
+			field[x][y] = cells[start : start+areaDepth : start+areaDepth]
 			for z := 0; z < areaDepth; z++ {
-				field[x][y][z] = Vector{VX: 0, VY: 0, VZ: -5, VX_: 0, VY_: 0, VZ_: 0}
+				field[x][y][z] = Vector{VX: 0, VY: 0, VZ: -5}
 			}
 		}
 	}
@@ -220,6 +235,10 @@ func initParticles(count int, windSources []WindSource, scene *core.Node) []Part
 	particles := make([]Particle, count)
 	sourceCount := len(windSources)
 
+	// A small sphere for visualization, shared by every particle
+	sphereGeom := geometry.NewSphere(0.1, 8, 8)
+	sphereMat := material.NewStandard(math32.NewColor("Blue"))
+
 	for i := 0; i < count; i++ {
 		// Distribute particles evenly across wind sources
 		wind := windSources[i%sourceCount]
@@ -238,10 +257,8 @@ func initParticles(count int, windSources []WindSource, scene *core.Node) []Part
 
 		position := wind.Position.Clone().Add(offset)
 
-		// Create a small sphere for visualization
-		sphereGeom := geometry.NewSphere(0.1, 8, 8)
-		sphereMat := material.NewStandard(math32.NewColor("Blue"))
-		sphereMesh := graphic.NewMesh(sphereGeom, sphereMat)
+		sphereMat.Incref()
+		sphereMesh := graphic.NewMesh(sphereGeom.Incref(), sphereMat)
 
 		// Correct positioning using SetPosition instead of SetPositionVec
 		sphereMesh.SetPosition(position.X, position.Y, position.Z)
@@ -308,23 +325,24 @@ func updateVectorField() {
 	for x := 0; x < vectorField.AreaWidth; x++ {
 		for y := 0; y < vectorField.AreaHeight; y++ {
 			for z := 0; z < vectorField.AreaDepth; z++ {
+				// The next velocity is computed in locals, so each cell only stores its current value
 				v := &vectorField.Field[x][y][z]
-				v.VX_ = (v.VX + rand.Float32()*0.1) * 0.9
-				v.VY_ = (v.VY + rand.Float32()*0.1) * 0.9
-				v.VZ_ = (v.VZ + rand.Float32()*0.1) * 0.9
-
-				// Limit velocity
-				magnitude := calcMagnitude3D(v.VX_, v.VY_, v.VZ_)
-				if magnitude > 1 {
-					scale := 1 / magnitude
-					v.VX_ *= scale
-					v.VY_ *= scale
-					v.VZ_ *= scale
+				vx := (v.VX + rand.Float32()*0.1) * 0.9
+				vy := (v.VY + rand.Float32()*0.1) * 0.9
+				vz := (v.VZ + rand.Float32()*0.1) * 0.9
+
+				// Limit velocity, only taking the square root when clamping
+				magnitudeSq := calcMagnitudeSq3D(vx, vy, vz)
+				if magnitudeSq > 1 {
+					scale := 1 / math32.Sqrt(magnitudeSq)
+					vx *= scale
+					vy *= scale
+					vz *= scale
 				}
 
-				v.VX = v.VX_
-				v.VY = v.VY_
-				v.VZ = v.VZ_
+				v.VX = vx
+				v.VY = vy
+				v.VZ = vz
 			}
 		}
 	}
@@ -332,7 +350,7 @@ func updateVectorField() {
 
 func drawParticles() {
 	for _, p := range fluidParticles {
-		log.Printf("Particle at (%.2f, %.2f, %.2f) moving with velocity (%.2f, %.2f, %.2f)", p.X, p.Y, p.Z, p.VX, p.VY, p.VZ)
+		logFrame("Particle at (%.2f, %.2f, %.2f) moving with velocity (%.2f, %.2f, %.2f)", p.X, p.Y, p.Z, p.VX, p.VY, p.VZ)
 	}
 }
 